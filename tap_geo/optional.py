@@ -0,0 +1,26 @@
+"""Optional dependencies, see the package extras.
+
+Modules using one import it under its flag:
+
+    if HAS_ORJSON:
+        import orjson
+"""
+
+from __future__ import annotations
+
+import importlib
+
+
+def _installed(name: str) -> bool:
+    """Return whether a module can be imported."""
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        return False
+    return True
+
+
+# The `orjson` extra, faster JSON (de)serialization
+HAS_ORJSON = _installed("orjson")
+# The `pyogrio` extra, engine=pyogrio
+HAS_PYOGRIO = _installed("pyogrio.raw")
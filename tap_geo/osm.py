@@ -1,26 +1,56 @@
 import osmium
-from shapely.geometry import Point, LineString
-from shapely.wkt import dumps as to_wkt
-from shapely.geometry import mapping
+
+# Frequent tag values, shared as one string object instead of one per tag
+COMMON_TAG_VALUES = {
+    value: value
+    for value in (
+        "yes",
+        "no",
+        "residential",
+        "service",
+        "track",
+        "footway",
+        "path",
+        "unclassified",
+        "tertiary",
+        "secondary",
+        "primary",
+        "house",
+        "building",
+        "parking",
+    )
+}
 
 
 class OSMHandler(osmium.SimpleHandler):
-    """OSM parser using pyosmium."""
+    """OSM parser using pyosmium, handing each record to `emit` as it is read.
+
+    Geometries are built as GeoJSON mappings straight from the node locations,
+    the stream encodes them to the configured format in batches.
+    """
 
-    def __init__(self, geom_fmt="wkt"):
+    def __init__(self, emit):
         super().__init__()
-        self.records = []
-        self.geom_fmt = geom_fmt
+        self.emit = emit
+        # Tag keys seen so far, each record reuses the first string read
+        self._keys: dict[str, str] = {}
+
+    def _tags(self, tags):
+        """Copy a tag list into a dict of interned keys and common values."""
+        key = self._keys.setdefault
+        value = COMMON_TAG_VALUES.get
+        return {key(k, k): value(v, v) for k, v in tags}
 
     def node(self, n):
-        geom = Point(n.location.lon, n.location.lat)
-        geom_out = to_wkt(geom) if self.geom_fmt == "wkt" else mapping(geom)
-        self.records.append(
+        self.emit(
             {
                 "id": str(n.id),
                 "type": "node",
-                "geometry": geom_out,
-                "tags": dict(n.tags),
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": (n.location.lon, n.location.lat),
+                },
+                "tags": self._tags(n.tags),
                 "metadata": {
                     "version": n.version,
                     "timestamp": str(n.timestamp),
@@ -31,30 +61,30 @@ class OSMHandler(osmium.SimpleHandler):
         )
 
     def way(self, w):
-        coords = [(n.lon, n.lat) for n in w.nodes if n.location.valid()]
-        geom = LineString(coords) if coords else None
-        if geom:
-            geom_out = to_wkt(geom) if self.geom_fmt == "wkt" else mapping(geom)
-        else:
-            geom_out = None
-        self.records.append(
+        coords = tuple((n.lon, n.lat) for n in w.nodes if n.location.valid())
+        self.emit(
             {
                 "id": str(w.id),
                 "type": "way",
-                "geometry": geom_out,
-                "tags": dict(w.tags),
+                # Ways cut by an extract may keep a single located node
+                "geometry": (
+                    {"type": "LineString", "coordinates": coords}
+                    if len(coords) >= 2
+                    else None
+                ),
+                "tags": self._tags(w.tags),
             }
         )
 
     def relation(self, r):
         # Relations can be complex; we’ll just collect members + tags
         members = [{"type": m.type, "ref": m.ref, "role": m.role} for m in r.members]
-        self.records.append(
+        self.emit(
             {
                 "id": str(r.id),
                 "type": "relation",
                 "geometry": None,  # could be constructed with osmium.geom, if desired
-                "tags": dict(r.tags),
+                "tags": self._tags(r.tags),
                 "members": members,
             }
         )
@@ -2,12 +2,37 @@
 
 from __future__ import annotations
 import os
+import shutil
 import typing as t
 from fsspec.core import url_to_fs
 from urllib.parse import urlparse
 from datetime import timezone, datetime
 from dataclasses import dataclass
 
+# Chunk size used when copying remote files locally
+COPY_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Keys under which fsspec backends report the modification time
+MTIME_KEYS = ("mtime", "last_modified", "LastModified")
+SIZE_KEYS = ("size", "Size")
+
+# GDAL virtual file systems reading remote objects with range requests
+VSI_PREFIXES = {
+    "s3": "/vsis3/",
+    "gs": "/vsigs/",
+    "gcs": "/vsigs/",
+    "http": "/vsicurl/http://",
+    "https": "/vsicurl/https://",
+}
+
+
+def _first_present(info: dict, keys: tuple[str, ...]) -> t.Any:
+    """Return the first value set under one of `keys`, falsy ones included."""
+    for key in keys:
+        if (value := info.get(key)) is not None:
+            return value
+    return None
+
 
 @dataclass
 class FileInfo:
@@ -37,18 +62,67 @@ class Storage:
 
     def glob(self) -> list[str]:
         """Return matching files for glob (always including protocol prefix)."""
-        paths = self.fs.glob(self.path_glob)
-
-        if self.path_glob.startswith("s3://"):
+        return self._with_protocol(self.fs.glob(self.path_glob))
+
+    def glob_detailed(self, pattern: str | None = None) -> list[FileInfo]:
+        """Return metadata of matching files, taken from the listing when possible.
+
+        Backends such as S3 report sizes and mtimes while listing, which saves a
+        HEAD request per file. Only entries listed without an mtime are described.
+        `pattern` defaults to the storage glob.
+        """
+        details = self.fs.glob(pattern or self.path_glob, detail=True)
+        infos = []
+        for path, info in zip(self._with_protocol(details), details.values()):
+            if _first_present(info, MTIME_KEYS) is not None:
+                infos.append(self._file_info(path, info))
+            else:
+                infos.append(self.describe(path))
+        return infos
+
+    def _with_protocol(self, paths: t.Iterable[str]) -> list[str]:
+        """Prefix remote paths with their protocol."""
+        if "://" in self.path_glob and not self.path_glob.startswith("file://"):
             # ensure full "s3://bucket/file"
-            return [f"s3://{p}" if not p.startswith("s3://") else p for p in paths]
+            return [self.fs.unstrip_protocol(p) for p in paths]
 
-        return paths
+        return list(paths)
 
     def open(self, path: str, mode: str = "rb") -> t.IO:
         """Open a file handle with fsspec."""
         return self.fs.open(path, mode)
 
+    def download(self, path: str, local_path: str | os.PathLike) -> None:
+        """Stream a file to a local path without loading it in memory."""
+        with self.open(path, "rb") as fh, open(local_path, "wb") as out:
+            shutil.copyfileobj(fh, out, COPY_CHUNK_SIZE)
+
+    def vsi_path(self, path: str) -> str | None:
+        """Return the GDAL virtual path of a remote file, None if unsupported."""
+        scheme, sep, rest = path.partition("://")
+        if not sep or scheme not in VSI_PREFIXES:
+            return None
+        return VSI_PREFIXES[scheme] + rest
+
+    def gdal_options(self) -> dict[str, str]:
+        """Return GDAL config options giving /vsis3/ the tap S3 credentials."""
+        if not self.path_glob.startswith("s3://"):
+            return {}
+        options = {
+            "AWS_ACCESS_KEY_ID": os.getenv("S3_ACCESS_KEY_ID"),
+            "AWS_SECRET_ACCESS_KEY": os.getenv("S3_SECRET_ACCESS_KEY"),
+        }
+        endpoint = os.getenv("S3_ENDPOINT_URL")
+        if endpoint:
+            url = urlparse(endpoint)
+            # Custom endpoints (minio) serve buckets as paths, not subdomains
+            options.update(
+                AWS_S3_ENDPOINT=url.netloc,
+                AWS_HTTPS="YES" if url.scheme == "https" else "NO",
+                AWS_VIRTUAL_HOSTING="FALSE",
+            )
+        return {k: v for k, v in options.items() if v}
+
     def describe(self, path: str) -> FileInfo:
         """Return normalized file metadata."""
         try:
@@ -57,9 +131,12 @@ class Storage:
             st = os.stat(path)
             info = {"name": path, "size": st.st_size, "mtime": st.st_mtime}
 
-        mtime_val: t.Any = (
-            info.get("mtime") or info.get("last_modified") or info.get("LastModified")
-        )
+        return self._file_info(path, info)
+
+    def _file_info(self, path: str, info: dict) -> FileInfo:
+        """Normalize an fsspec info dict into a FileInfo."""
+        # A size or mtime of 0 is a value, not a missing key
+        mtime_val: t.Any = _first_present(info, MTIME_KEYS)
         if isinstance(mtime_val, (int, float)):
             mtime = datetime.fromtimestamp(mtime_val, tz=timezone.utc)
         elif callable(getattr(mtime_val, "timestamp", None)):
@@ -73,7 +150,7 @@ class Storage:
         else:
             mtime = datetime.now(timezone.utc)
 
-        size_val = info.get("size") or info.get("Size")
+        size_val = _first_present(info, SIZE_KEYS)
         try:
             size = int(size_val) if size_val is not None else None
         except (TypeError, ValueError):
@@ -87,8 +164,8 @@ class Storage:
 
     def normalize_path(self, path: str) -> str:
         """Normalize local/remote path."""
-        if path.startswith(("s3://", "gs://", "http://", "https://")):
-            return path
         if path.startswith("file://"):
             return urlparse(path).path
+        if "://" in path:
+            return path
         return os.path.abspath(path)
@@ -5,34 +5,416 @@ import typing as t
 import tempfile
 import os
 import json
+import hashlib
+import shutil
+import queue
 import sqlite3
+import sys
+import threading
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
 
+import osmium
+import osmium.filter
+import shapely
 import shapely.geometry
-from shapely.wkt import dumps as to_wkt
-from shapely.wkb import loads as from_wkb
 import shapefile  # pyshp
 import gpxpy
 
+from singer_sdk.helpers._state import (
+    get_starting_replication_value,
+    get_state_if_exists,
+)
 from singer_sdk.streams import Stream
 from singer_sdk import typing as th
 
-from .storage import Storage, FileInfo
+from .storage import FileInfo, Storage
 from .osm import OSMHandler
-from contextlib import contextmanager
+from .optional import HAS_ORJSON, HAS_PYOGRIO
+from contextlib import closing, contextmanager, suppress
+from functools import cached_property, partial
+from concurrent.futures import ThreadPoolExecutor
 
 if t.TYPE_CHECKING:
     from singer_sdk.helpers.types import Context
     from singer_sdk.tap_base import Tap
 
+if HAS_PYOGRIO:
+    import pyogrio.raw
+if HAS_ORJSON:
+    import orjson
+
 SDC_INCREMENTAL_KEY = "_sdc_last_modified"
 SDC_FILENAME = "_sdc_filename"
 
+# Files composing a shapefile bundle, staged together for remote storages:
+# the required components, then the optional sidecars
+SHAPEFILE_COMPONENTS = (".shp", ".shx", ".dbf")
+SHAPEFILE_SIDECARS = (".prj", ".cpg")
+
+# Marker written once a cached remote file is completely downloaded
+CACHE_SENTINEL = ".complete"
+# Age after which a cache staging dir is left over by a crashed run
+STALE_STAGING_SECONDS = 24 * 3600
+
+# Features per vectorized geometry conversion
+GEOMETRY_BATCH_SIZE = 1024
+
+# Warnings logged per stream for features skipped over an invalid geometry
+GEOMETRY_ERROR_LOG_LIMIT = 100
+
+# Formats read through GDAL with engine=pyogrio, mapped to the metadata driver
+OGR_DRIVERS = {
+    ".shp": "shapefile",
+    ".geojson": "geojson",
+    ".json": "geojson",
+    ".gpkg": "gpkg",
+}
+
+# Rows per Arrow batch streamed and converted to records with engine=pyogrio
+OGR_BATCH_SIZE = 10_000
+
+# GDAL settings for remote reads (read_in_place), coalescing range requests
+VSI_GDAL_OPTIONS = {
+    "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+    "CPL_VSIL_CURL_CACHE_SIZE": "256000000",
+}
+
+# OSM records buffered between the pyosmium thread and the stream, handed
+# over in chunks to keep the queue overhead off the per-record path
+OSM_QUEUE_SIZE = 10_000
+OSM_CHUNK_SIZE = 500
+
+# Records per chunk handed over by a parse_parallelism worker, and chunks
+# buffered per file before the worker waits for the stream to catch up
+PARSE_CHUNK_SIZE = 10_000
+PARSE_QUEUE_DEPTH = 4
+
+
+def _to_wkt(geoms: t.Any) -> list[str | None]:
+    """Encode Shapely geometries as WKT with one vectorized call."""
+    return shapely.to_wkt(geoms, rounding_precision=-1, trim=False).tolist()
+
+
+def _shape_to_geojson(shape: shapefile.Shape) -> dict | None:
+    """Return the GeoJSON mapping of a pyshp shape, None for NULL shapes."""
+    if shape.shapeType == shapefile.NULL:
+        return None
+    return shape.__geo_interface__
+
+
+def _geojson_to_wkt(geoms: list[dict | None]) -> list[str | None]:
+    """Encode GeoJSON mappings as WKT."""
+    return _to_wkt([shapely.geometry.shape(g) if g else None for g in geoms])
+
+
+def _wkb_to_wkt(blobs: list[bytes]) -> list[str | None]:
+    """Encode WKB blobs as WKT."""
+    return _to_wkt(shapely.from_wkb(blobs))
+
+
+def _wkb_to_geojson(blobs: list[bytes]) -> list[dict | None]:
+    """Encode WKB blobs as GeoJSON mappings."""
+    return [None if g is None else g.__geo_interface__ for g in shapely.from_wkb(blobs)]
+
+
+def _geojson_to_str(geoms: list[dict | None]) -> list[str | None]:
+    """Serialize GeoJSON mappings as JSON strings."""
+    return [_json_dumps(g) if g else None for g in geoms]
+
+
+def _null_geometries(geoms: list) -> list[None]:
+    """Drop geometries, for skip_geometry."""
+    return [None] * len(geoms)
+
+
+def _wkb_to_geojson_str(blobs: list[bytes]) -> list[str | None]:
+    """Encode WKB blobs as GeoJSON strings, written by GEOS in one call."""
+    return shapely.to_geojson(shapely.from_wkb(blobs)).tolist()
+
+
+if HAS_ORJSON:
+
+    def _json_dumps(value: t.Any) -> str:
+        """Serialize a value as compact JSON."""
+        return orjson.dumps(value).decode()
+
+else:
+
+    def _json_dumps(value: t.Any) -> str:
+        """Serialize a value as compact JSON."""
+        return json.dumps(value, separators=(",", ":"))
+
+
+# Digits mapped to "0" and any other byte to " ", to find runs of digits fast
+_DIGIT_RUNS = bytes(0x30 if 0x30 <= b <= 0x39 else 0x20 for b in range(256))
+# Integers beyond 64 bits, which orjson parses as floats, have 19+ digits
+_LONG_DIGIT_RUN = b"0" * 19
+
+
+def _load_json(path: str) -> t.Any:
+    """Parse a JSON file, with orjson when installed.
+
+    Files with a run of 19 or more digits are parsed by json, which keeps
+    integers beyond 64 bits exact. Long fractions or digit strings only cost
+    the faster parser.
+    """
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if HAS_ORJSON and _LONG_DIGIT_RUN not in data.translate(_DIGIT_RUNS):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN or a BOM, which json accepts
+    return json.loads(data)
+
+
+# Internal geometry_format of streams configured with skip_geometry
+NO_GEOMETRY = "none"
+
+# Batch encoders turning reader geometries into the configured geometry_format,
+# missing entries mean the reader output is already in that format
+GEOJSON_ENCODERS = {
+    "wkt": _geojson_to_wkt,
+    "geojson_str": _geojson_to_str,
+    NO_GEOMETRY: _null_geometries,
+}
+WKB_ENCODERS = {
+    "wkt": _wkb_to_wkt,
+    "geojson": _wkb_to_geojson,
+    "geojson_str": _wkb_to_geojson_str,
+    NO_GEOMETRY: _null_geometries,
+}
+
+
+def _encode_geometries(
+    records: t.Iterable[dict],
+    encode: t.Callable[[list], list],
+    on_error: t.Callable[[dict, Exception], None] | None = None,
+    batch_size: int = GEOMETRY_BATCH_SIZE,
+) -> t.Iterator[dict]:
+    """Re-encode the `geometry` of records in batches to amortize Shapely calls.
+
+    Records whose geometry fails to encode are dropped and handed to
+    `on_error`, without it the error is raised.
+    """
+    batch: list[dict] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == batch_size:
+            yield from _encode_batch(batch, encode, on_error)
+            batch = []
+    yield from _encode_batch(batch, encode, on_error)
+
+
+def _encode_batch(
+    batch: list[dict],
+    encode: t.Callable[[list], list],
+    on_error: t.Callable[[dict, Exception], None] | None = None,
+) -> list[dict]:
+    """Replace the geometries of a batch of records in place."""
+    if not batch:
+        return batch
+    try:
+        geoms = encode([r["geometry"] for r in batch])
+    except Exception:
+        if on_error is None:
+            raise
+        # Only invalid batches pay for encoding their records one by one
+        return [r for r in batch if _encode_record(r, encode, on_error)]
+    for record, geom in zip(batch, geoms):
+        record["geometry"] = geom
+    return batch
+
+
+def _encode_record(
+    record: dict,
+    encode: t.Callable[[list], list],
+    on_error: t.Callable[[dict, Exception], None],
+) -> bool:
+    """Replace the geometry of a single record, return whether it succeeded."""
+    try:
+        record["geometry"] = encode([record["geometry"]])[0]
+    except Exception as e:
+        on_error(record, e)
+        return False
+    return True
+
+
+# JSON schema types of record values, looked up along the value type's MRO
+# (so bool resolves to int, as isinstance does)
+SCHEMA_TYPES: dict[type, t.Callable[[], th.JSONTypeHelper]] = {
+    int: lambda: th.NumberType(nullable=True),
+    float: lambda: th.NumberType(nullable=True),
+    str: lambda: th.StringType(nullable=True),
+    dict: lambda: th.ObjectType(additional_properties=True, nullable=True),
+}
+
+
+def _lookup_schema_type(value: t.Any) -> th.JSONTypeHelper | None:
+    """Return the schema type of a scalar or mapping value, if known."""
+    for cls in type(value).__mro__:
+        if (factory := SCHEMA_TYPES.get(cls)) is not None:
+            return factory()
+    return None
+
+
+def _schema_type(value: t.Any) -> th.JSONTypeHelper:
+    """Infer the JSON schema type of a record value."""
+    if isinstance(value, list):
+        # Element type of the first non-null element, if any
+        elem = next((e for e in value if e is not None), None)
+        elem_type = None if elem is None else _lookup_schema_type(elem)
+        return th.ArrayType(
+            elem_type or th.CustomType({"type": ["null", "string", "object", "number"]})
+        )
+    # Generic fallback type: allow arrays too, to prevent schema rejection
+    return _lookup_schema_type(value) or th.CustomType(
+        {"type": ["null", "string", "object", "number", "array"]}
+    )
+
+
+def _put_unless_cancelled(
+    out: queue.Queue, item: t.Any, cancelled: threading.Event
+) -> bool:
+    """Put an item on a bounded queue, giving up once `cancelled` is set.
+
+    Also gives up once the main thread is done, so a producer left behind never
+    keeps the interpreter from exiting.
+    """
+    main = threading.main_thread()
+    while not cancelled.is_set() and main.is_alive():
+        try:
+            out.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+# Default of dict.pop telling a missing key from a None value
+_MISSING = object()
+
+
+class _ReadCancelled(Exception):
+    """Raised in a reader callback to stop a read nobody consumes anymore."""
+
+
+def _fetch_optional(st: Storage, path: str, local_path: Path) -> bool:
+    """Download a file if it exists on the storage, return whether it did."""
+    try:
+        st.download(path, local_path)
+    except Exception:
+        return False
+    return True
+
+
+# `(info, partition_context, parse)` of a file to sync, `parse()` yields records
+_ListedFile = tuple[FileInfo, dict[str, str], t.Callable[[], t.Iterator[dict]]]
+
+
+class _ParsePool:
+    """Threads parsing files ahead of the stream emitting them (parse_parallelism).
+
+    Every file gets a bounded queue of record chunks. Files are submitted in
+    the order they are emitted, hence the file being drained always has a
+    running worker. Streams synced next are read ahead by up to `workers`
+    files, so single-file streams overlap too. Files not newer than their
+    bookmark are never submitted, the bookmarks of streams read ahead are
+    peeked at without touching their state.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self.closed = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="tap-geo"
+        )
+        # Files submitted per stream, with their record queue and cancel event
+        self._submitted: dict[GeoStream, list[tuple]] = {}
+
+    def parse(
+        self, stream: GeoStream, following: list[GeoStream]
+    ) -> t.Generator[tuple[_ListedFile, t.Iterator[dict]], None, None]:
+        """Yield `(file, records)` of the files of a stream left to sync."""
+        self._submit(stream)
+        ahead = 0
+        for other in following:
+            if ahead >= self.workers:
+                break
+            ahead += len(self._submit(other, peek=True))
+        completed = False
+        try:
+            for file, out, _ in self._submitted.pop(stream):
+                yield file, self._drain(out)
+            completed = True
+        finally:
+            # Nothing left to read ahead, or the sync is failing
+            if not completed or not self._submitted:
+                self.close()
+
+    def close(self) -> None:
+        """Stop the workers, dropping whatever they read ahead."""
+        self.closed = True
+        for submitted in self._submitted.values():
+            for _, _, cancelled in submitted:
+                cancelled.set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit(self, stream: GeoStream, peek: bool = False) -> list[tuple]:
+        """Queue the files of a stream left to sync, once."""
+        submitted = self._submitted.get(stream)
+        if submitted is None:
+            submitted = self._submitted[stream] = []
+            for file in stream._listed_files():
+                if stream._unchanged(*file[:2], peek=peek):
+                    continue
+                out: queue.Queue = queue.Queue(maxsize=PARSE_QUEUE_DEPTH)
+                cancelled = threading.Event()
+                self._executor.submit(self._produce, file[2], out, cancelled)
+                submitted.append((file, out, cancelled))
+        return submitted
+
+    @staticmethod
+    def _produce(
+        parse: t.Callable, out: queue.Queue, cancelled: threading.Event
+    ) -> None:
+        if cancelled.is_set() or not threading.main_thread().is_alive():
+            return
+        try:
+            with closing(parse()) as records:
+                chunk: list[dict] = []
+                for record in records:
+                    chunk.append(record)
+                    if len(chunk) >= PARSE_CHUNK_SIZE:
+                        if not _put_unless_cancelled(out, chunk, cancelled):
+                            return
+                        chunk = []
+                if chunk and not _put_unless_cancelled(out, chunk, cancelled):
+                    return
+            _put_unless_cancelled(out, None, cancelled)
+        except BaseException as e:  # noqa: BLE001, re-raised by the consumer
+            _put_unless_cancelled(out, e, cancelled)
+
+    @staticmethod
+    def _drain(out: queue.Queue) -> t.Iterator[dict]:
+        while (item := out.get()) is not None:
+            if isinstance(item, BaseException):
+                raise item
+            yield from item
+
+
+# Parse pool shared by the streams of a tap, kept until the tap goes away
+_PARSE_POOLS: weakref.WeakKeyDictionary[Tap, _ParsePool] = weakref.WeakKeyDictionary()
+
 
 class GeoStream(Stream):
     """Stream for geospatial files (SHP, GeoJSON, GPX, OSM/PBF, GPKG) supporting fsspec storage."""
 
+    # Bookmarks only move when a file is done, STATE is written then instead
+    STATE_MSG_FREQUENCY = sys.maxsize
+
     def __init__(self, tap: Tap, file_cfg: dict) -> None:
         self.file_cfg = file_cfg
         self.path_patterns = file_cfg.get("paths", [])
@@ -54,13 +436,49 @@ class GeoStream(Stream):
 
         self.core_fields = ["geometry", "features", "metadata"]
         self.expose_fields: list[str] = [
-            p.lower()
+            name
             for p in file_cfg.get("expose_fields", [])
-            if p.lower() not in self.core_fields
+            if (name := p.lower()) not in self.core_fields
         ]
         for pk in self.primary_keys:
             if pk not in self.expose_fields:
                 self.expose_fields.append(pk)
+        # Lookups used per field and per feature, primary keys may be core ones
+        self._expose_set: set[str] = set(self.expose_fields)
+        self._expose_minus_core: tuple[str, ...] = tuple(
+            f for f in self.expose_fields if f not in self.core_fields
+        )
+
+        # OSM records carry their own id/type/members columns
+        self._osm_reserved = {*self.core_fields, "id", "type", "members"}
+        self._osm_expose = tuple(
+            f for f in self._expose_minus_core if f not in self._osm_reserved
+        )
+        self._osm_expose_set = set(self._osm_expose)
+
+        self.project_only_exposed = bool(file_cfg.get("project_only_exposed"))
+        self.read_in_place = bool(file_cfg.get("read_in_place"))
+        self.engine = file_cfg.get("engine") or "native"
+        if self.engine not in ("native", "pyogrio"):
+            raise ValueError(f"Unsupported engine: {self.engine}")
+        self.osm_location_index: str | None = file_cfg.get("osm_location_index")
+        if (
+            self.osm_location_index
+            and self.osm_location_index.split(",", 1)[0] not in osmium.index.map_types()
+        ):
+            raise ValueError(
+                f"Unsupported osm_location_index: {self.osm_location_index}"
+            )
+        self.osm_tagged_nodes_only = bool(file_cfg.get("osm_tagged_nodes_only"))
+
+        # Parsed bookmarks keyed by their ISO string, shared across files
+        self._bookmark_cache: dict[str, datetime] = {}
+        # pyogrio layer names and fields keyed by source path and mtime
+        self._ogr_layout_cache: dict[tuple[str, datetime], list] = {}
+        # Features skipped over an invalid geometry, only the first are logged
+        self._geometry_errors = 0
+        # Set while the schema peeks at a file, its errors are logged on sync
+        self._peeking = False
 
         self.tap = tap
         self.storages = [Storage(pat) for pat in self.path_patterns]
@@ -69,40 +487,110 @@ class GeoStream(Stream):
     # Utility: staged local file for remote handling
     # -------------------------------------------------------------------------
     @contextmanager
-    def _staged_local_file(self, st: Storage, path: str):
-        """Yield a local filesystem path; downloads to temp dir if remote."""
+    def _staged_local_file(self, st: Storage, path: str, mtime: datetime):
+        """Yield a local filesystem path; downloads to the cache dir if remote.
+
+        Without a `cache_dir` remote files are downloaded to a temporary
+        directory, removed once read.
+        """
         if os.path.exists(path):
             yield path
             return
 
-        suffix = Path(path).suffix.lower()
-        with tempfile.TemporaryDirectory() as tmpdir:
-            local_path = Path(tmpdir) / Path(path).name
-
-            if suffix == ".shp":
-                base = os.path.splitext(path)[0]
-                for ext in [".shp", ".shx", ".dbf", ".prj", ".cpg"]:
-                    candidate = base + ext
-                    try:
-                        with (
-                            st.open(candidate, "rb") as fh,
-                            open(Path(tmpdir) / Path(candidate).name, "wb") as out,
-                        ):
-                            out.write(fh.read())
-                    except Exception:
-                        continue
-            else:
-                with st.open(path, "rb") as fh, open(local_path, "wb") as out:
-                    out.write(fh.read())
+        cache_dir = self.tap.config.get("cache_dir")
+        if not cache_dir:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                self._download_bundle(st, path, Path(tmpdir))
+                yield str(Path(tmpdir) / Path(path).name)
+            return
+
+        if Path(path).suffix.lower() == ".shp":
+            # Any component may change on its own, the entry follows the newest
+            mtime = self._shapefile_mtime(st, path, mtime)
+        entry = self._cache_entry(cache_dir, path, mtime)
+        if not (entry / CACHE_SENTINEL).exists():
+            self._populate_cache_entry(st, path, entry)
+
+        yield str(entry / Path(path).name)
+
+    @staticmethod
+    def _cache_entry(cache_dir: str, path: str, mtime: datetime) -> Path:
+        """Return the cache directory for a remote file at a given mtime."""
+        digest = hashlib.sha256(path.encode("utf-8")).hexdigest()[:16]
+        return Path(cache_dir) / digest / str(int(mtime.timestamp()))
+
+    @staticmethod
+    def _shapefile_mtime(st: Storage, path: str, mtime: datetime) -> datetime:
+        """Return the newest mtime across the files of a shapefile bundle."""
+        base = os.path.splitext(path)[0]
+        exts = (*SHAPEFILE_COMPONENTS, *SHAPEFILE_SIDECARS)
+        # One listing covers the bundle, missing components fail the download
+        listed = st.glob_detailed(base + ".*")
+        return max(
+            [mtime, *(f.mtime for f in listed if os.path.splitext(f.path)[1] in exts)]
+        )
+
+    @staticmethod
+    def _download_bundle(st: Storage, path: str, dest: Path) -> None:
+        """Download a remote file (and sidecars) into a local directory."""
+        if Path(path).suffix.lower() != ".shp":
+            st.download(path, dest / Path(path).name)
+            return
+
+        # Fetch the bundle concurrently, only optional sidecars may be missing
+        base = os.path.splitext(path)[0]
+
+        def fetch(ext: str) -> bool:
+            remote, local = base + ext, dest / Path(base + ext).name
+            if ext in SHAPEFILE_SIDECARS:
+                return _fetch_optional(st, remote, local)
+            st.download(remote, local)
+            return True
+
+        exts = (*SHAPEFILE_COMPONENTS, *SHAPEFILE_SIDECARS)
+        with ThreadPoolExecutor(max_workers=len(exts)) as pool:
+            list(pool.map(fetch, exts))
 
-            yield str(local_path)
+    def _populate_cache_entry(self, st: Storage, path: str, entry: Path) -> None:
+        """Download a remote file (and sidecars) then publish it atomically."""
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f"{entry.name}.", dir=entry.parent))
+        try:
+            # An incomplete bundle fails before the sentinel, it is never cached
+            self._download_bundle(st, path, staging)
+            (staging / CACHE_SENTINEL).touch()
+
+            if entry.exists():
+                # Leftover without sentinel, or a concurrent run got there first
+                shutil.rmtree(entry, ignore_errors=True)
+            try:
+                os.rename(staging, entry)
+            except OSError:
+                if not (entry / CACHE_SENTINEL).exists():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        # Drop copies of older versions of the same file, and staging dirs
+        # left by crashed runs once concurrent ones must be done with them
+        stale_staging = datetime.now().timestamp() - STALE_STAGING_SECONDS
+        for stale in entry.parent.iterdir():
+            if stale.name == entry.name:
+                continue
+            with suppress(FileNotFoundError):
+                if "." not in stale.name or stale.stat().st_mtime < stale_staging:
+                    shutil.rmtree(stale, ignore_errors=True)
 
     # -------------------------------------------------------------------------
     # Schema building (aligned with parsing)
     # -------------------------------------------------------------------------
-    @property
+    @cached_property
     def schema(self) -> dict:
-        """Infer schema from the first available file by introspection."""
+        """Infer schema from the first available file by introspection.
+
+        The SDK reads the schema many times per sync, so it is computed once to
+        avoid listing storages and staging the first file again.
+        """
         test_path = None
         storage = None
         for st in self.storages:
@@ -115,74 +603,30 @@ class GeoStream(Stream):
             raise FileNotFoundError("No files found for GeoStream schema detection")
 
         suffix = Path(test_path).suffix.lower()
-
-        parser_map = {
-            ".shp": self._peek_shapefile,
-            ".geojson": self._peek_geojson,
-            ".json": self._peek_geojson,
-            ".gpx": self._peek_gpx,
-            ".osm": self._peek_osm,
-            ".pbf": self._peek_osm,
-            ".gpkg": self._peek_gpkg,
-        }
-
-        parser = parser_map.get(suffix)
+        parser = self._file_parser(suffix)
         if not parser:
             raise ValueError(f"Unsupported file type for schema: {suffix}")
+        if parser == self._parse_ogr:
+            # One feature is enough for the schema, skip decoding a full batch
+            parser = partial(self._parse_ogr, batch_size=1)
 
-        first_record = next(parser(storage, test_path), None)
+        # Peek through the sync parsers so both always agree on the record shape
+        info = storage.describe(test_path)
+        self._peeking = True
+        try:
+            records = parser(storage, info.path, set(), "wkt", info.mtime)
+            with closing(records):
+                first_record = next(records, None)
+        finally:
+            self._peeking = False
         if not first_record:
             raise ValueError(f"No records found for schema inference: {test_path}")
 
-        properties: list[th.Property] = []
-
-        for k, v in first_record.items():
-            if k in (SDC_INCREMENTAL_KEY, SDC_FILENAME):
-                continue
-
-            tpe: t.Any
-            # --- Explicit type detection order (list first)
-            if isinstance(v, list):
-                # Infer element type if possible
-                elem_type: t.Any | None = None
-                for elem in v:
-                    if elem is None:
-                        continue
-                    if isinstance(elem, (int, float)):
-                        elem_type = th.NumberType(nullable=True)
-                    elif isinstance(elem, str):
-                        elem_type = th.StringType(nullable=True)
-                    elif isinstance(elem, dict):
-                        elem_type = th.ObjectType(
-                            additional_properties=True, nullable=True
-                        )
-                    else:
-                        elem_type = th.CustomType(
-                            {"type": ["null", "string", "object", "number"]}
-                        )
-                    break
-                if elem_type is None:
-                    elem_type = th.CustomType(
-                        {"type": ["null", "string", "object", "number"]}
-                    )
-                tpe = th.ArrayType(elem_type)
-
-            elif isinstance(v, (int, float)):
-                tpe = th.NumberType(nullable=True)
-
-            elif isinstance(v, str):
-                tpe = th.StringType(nullable=True)
-
-            elif isinstance(v, dict):
-                tpe = th.ObjectType(additional_properties=True, nullable=True)
-
-            else:
-                # Generic fallback type: allow arrays too, to prevent schema rejection
-                tpe = th.CustomType(
-                    {"type": ["null", "string", "object", "number", "array"]}
-                )
-
-            properties.append(th.Property(k, tpe))
+        properties = [
+            th.Property(k, _schema_type(v))
+            for k, v in first_record.items()
+            if k not in (SDC_INCREMENTAL_KEY, SDC_FILENAME)
+        ]
 
         # Always include incremental + filename keys
         properties.extend(
@@ -198,218 +642,428 @@ class GeoStream(Stream):
     # -------------------------------------------------------------------------
     def get_records(self, context: Context | None) -> t.Iterable[dict]:
         """Iterate through all files in configured storages."""
-        skip_fields = set(self.tap.config.get("skip_fields", []))
-        geom_fmt = self.tap.config.get("geometry_format", "wkt")
+        workers = int(self.tap.config.get("parse_parallelism") or 1)
+        parsed: t.Generator[tuple[_ListedFile, t.Iterator[dict]], None, None]
+        if workers > 1:
+            parsed = self._parse_pool(workers).parse(self, self._following_streams())
+        else:
+            files = [f for f in self._listed_files() if not self._unchanged(*f[:2])]
+            parsed = ((file, file[2]()) for file in files)
 
-        for st in self.storages:
-            for path in st.glob():
-                info: FileInfo = st.describe(path)
-
-                partition_context = {SDC_FILENAME: os.path.basename(info.path)}
-                last_bookmark = self.get_starting_replication_key_value(
-                    partition_context
-                )
-                bookmark_dt = None
-                if last_bookmark:
-                    bookmark_dt = datetime.fromisoformat(last_bookmark)
-                    if bookmark_dt.tzinfo is None:
-                        bookmark_dt = bookmark_dt.replace(tzinfo=timezone.utc)
-
-                if bookmark_dt and info.mtime <= bookmark_dt:
-                    self.logger.info(
-                        "Skipping %s (mtime=%s <= bookmark=%s)",
-                        info.path,
-                        info.mtime,
-                        bookmark_dt,
-                    )
-                    continue
-
-                suffix = Path(info.path).suffix.lower()
+        with closing(parsed):
+            for (info, partition_context, _), records in parsed:
                 try:
-                    if suffix == ".shp":
-                        yield from self._parse_shapefile(
-                            st, info.path, skip_fields, geom_fmt, info.mtime
-                        )
-                    elif suffix in (".geojson", ".json"):
-                        yield from self._parse_geojson(
-                            st, info.path, skip_fields, geom_fmt, info.mtime
-                        )
-                    elif suffix == ".gpx":
-                        yield from self._parse_gpx(st, info.path, geom_fmt, info.mtime)
-                    elif suffix in (".osm", ".pbf"):
-                        yield from self._parse_osm(st, info.path, geom_fmt, info.mtime)
-                    elif suffix == ".gpkg":
-                        yield from self._parse_gpkg(
-                            st, info.path, skip_fields, geom_fmt, info.mtime
-                        )
-                    else:
-                        self.logger.warning(
-                            "Skipping unsupported file suffix %s", suffix
-                        )
-                        continue
+                    yield from records
 
                     self._increment_stream_state(
                         {SDC_INCREMENTAL_KEY: info.mtime.isoformat()},
                         context=partition_context,
                     )
+                    # The file is done, its bookmark can be resumed from
+                    self._finalize_state(self.get_context_state(partition_context))
+                    self._write_state_message()
                 except Exception as e:
                     self.logger.exception("Failed parsing file %s: %s", info.path, e)
                     raise
 
+    def _listed_files(self) -> list[_ListedFile]:
+        """Return `(info, partition_context, parse)` of the supported files.
+
+        `parse()` yields the records of the file. Listing does not read the
+        stream state, so files of the next streams can be listed ahead.
+        """
+        # Per-file settings, unset ones fall back to the tap-level values
+        skip_fields = self.file_cfg.get("skip_fields")
+        if skip_fields is None:
+            skip_fields = self.tap.config.get("skip_fields", [])
+        skip_fields = set(skip_fields)
+        geom_fmt = self.file_cfg.get("geometry_format") or self.tap.config.get(
+            "geometry_format", "wkt"
+        )
+        if self.file_cfg.get("skip_geometry") or "geometry" in skip_fields:
+            # Geometries are emitted as null without being decoded or encoded
+            geom_fmt = NO_GEOMETRY
+
+        files: list[_ListedFile] = []
+        for st in self.storages:
+            for info in st.glob_detailed():
+                suffix = Path(info.path).suffix.lower()
+                parser = self._file_parser(suffix)
+                if parser is None:
+                    self.logger.warning("Skipping unsupported file suffix %s", suffix)
+                    continue
+                parse = partial(
+                    parser, st, info.path, skip_fields, geom_fmt, info.mtime
+                )
+                files.append((info, {SDC_FILENAME: os.path.basename(info.path)}, parse))
+        return files
+
+    def _unchanged(
+        self, info: FileInfo, partition_context: dict, peek: bool = False
+    ) -> bool:
+        """Return whether a file is not newer than its bookmark, logging it."""
+        bookmark_dt = self._bookmark(partition_context, peek)
+        if bookmark_dt and info.mtime <= bookmark_dt:
+            self.logger.info(
+                "Skipping %s (mtime=%s <= bookmark=%s)",
+                info.path,
+                info.mtime,
+                bookmark_dt,
+            )
+            return True
+        return False
+
+    def _file_parser(
+        self, suffix: str
+    ) -> t.Callable[..., t.Generator[dict, None, None]] | None:
+        """Return `parse(st, path, skip_fields, geom_fmt, mtime)` for a suffix."""
+        if self.engine == "pyogrio" and suffix in OGR_DRIVERS:
+            return self._parse_ogr
+        if suffix == ".shp":
+            return self._parse_shapefile
+        if suffix in (".geojson", ".json"):
+            return self._parse_geojson
+        if suffix == ".gpx":
+            return lambda st, path, _skip, geom_fmt, mtime: self._parse_gpx(
+                st, path, geom_fmt, mtime
+            )
+        if suffix in (".osm", ".pbf"):
+            return lambda st, path, _skip, geom_fmt, mtime: self._parse_osm(
+                st, path, geom_fmt, mtime
+            )
+        if suffix == ".gpkg":
+            return self._parse_gpkg
+        return None
+
+    def _parse_pool(self, workers: int) -> _ParsePool:
+        """Return the parse pool shared by the streams of the tap."""
+        pool = _PARSE_POOLS.get(self.tap)
+        if pool is None or pool.closed:
+            pool = _PARSE_POOLS[self.tap] = _ParsePool(workers)
+        return pool
+
+    def _following_streams(self) -> list[GeoStream]:
+        """Return the selected streams synced after this one, in sync order."""
+        streams = list(self.tap.streams.values())
+        if self not in streams:
+            return []
+        return [
+            s
+            for s in streams[streams.index(self) + 1 :]
+            if isinstance(s, GeoStream) and s.selected
+        ]
+
+    def _bookmark(self, partition_context: dict, peek: bool = False) -> datetime | None:
+        """Return the partition bookmark as an aware datetime, parsed once.
+
+        With `peek` the state is only read, so streams not syncing yet keep the
+        state they started with.
+        """
+        if peek:
+            last_bookmark = get_starting_replication_value(
+                get_state_if_exists(self.tap_state, self.name, partition_context) or {}
+            )
+        else:
+            last_bookmark = self.get_starting_replication_key_value(partition_context)
+        if not last_bookmark:
+            return None
+        bookmark_dt = self._bookmark_cache.get(last_bookmark)
+        if bookmark_dt is None:
+            bookmark_dt = datetime.fromisoformat(last_bookmark)
+            if bookmark_dt.tzinfo is None:
+                bookmark_dt = bookmark_dt.replace(tzinfo=timezone.utc)
+            self._bookmark_cache[last_bookmark] = bookmark_dt
+        return bookmark_dt
+
     # -------------------------------------------------------------------------
     # Parsers
     # -------------------------------------------------------------------------
+    def _invalid_geometry(self, record: dict, error: Exception) -> None:
+        """Log a feature skipped over its geometry, up to a limit per stream."""
+        if self._peeking:
+            return
+        self._geometry_errors += 1
+        if self._geometry_errors <= GEOMETRY_ERROR_LOG_LIMIT:
+            self.logger.warning(
+                "Skipping feature of %s with an invalid geometry: %s",
+                record[SDC_FILENAME],
+                error,
+            )
+        if self._geometry_errors == GEOMETRY_ERROR_LOG_LIMIT:
+            self.logger.warning(
+                "Logged %d invalid geometries, further ones are skipped silently",
+                GEOMETRY_ERROR_LOG_LIMIT,
+            )
+
+    def _field_plan(
+        self, keys: t.Iterable[t.Any], names: t.Iterable[str], skip_fields: set
+    ) -> tuple[list[tuple[t.Any, str]], list[tuple[t.Any, str]]]:
+        """Split source fields into exposed and `features` columns.
+
+        Computed once per field layout so the per-feature work is a plain lookup.
+        Returns `(source_key, column)` pairs, exposed ones in `expose_fields` order.
+        """
+        columns = {
+            column: key
+            for key, name in zip(keys, names)
+            if (column := name.lower()) not in skip_fields
+        }
+        exposed = [(columns.pop(k), k) for k in self._expose_minus_core if k in columns]
+        return exposed, [(key, col) for col, key in columns.items()]
+
+    def _projected(self, names: list[str]) -> list[str]:
+        """Return the source fields to read, only exposed ones if projecting."""
+        if not self.project_only_exposed:
+            return names
+        return [n for n in names if n.lower() in self._expose_set]
+
     def _parse_shapefile(self, st, path, skip_fields, geom_fmt, mtime):
-        with self._staged_local_file(st, path) as local:
-            reader = shapefile.Reader(local)
-            fields = reader.fields[1:]
-            field_names = [f[0].lower() for f in fields]
-
-            for sr in reader.iterShapeRecords():
-                geom = shapely.geometry.shape(sr.shape.__geo_interface__)
-                geom_out = to_wkt(geom) if geom_fmt == "wkt" else geom.__geo_interface__
-                props = {
-                    field_names[i]: sr.record[i]
-                    for i in range(len(field_names))
-                    if field_names[i] not in skip_fields
-                }
-                exposed = {
-                    k: props.pop(k) for k in list(self.expose_fields) if k in props
-                }
-                yield {
-                    **exposed,
-                    "geometry": geom_out,
-                    "features": props,
-                    "metadata": {"source": path, "driver": "shapefile"},
-                    SDC_INCREMENTAL_KEY: mtime,
-                    SDC_FILENAME: os.path.basename(path),
-                }
+        with self._staged_local_file(st, path, mtime) as local:
+            records = self._read_shapefile(
+                local, path, skip_fields, mtime, shapes=geom_fmt != NO_GEOMETRY
+            )
+            if encode := GEOJSON_ENCODERS.get(geom_fmt):
+                records = _encode_geometries(records, encode, self._invalid_geometry)
+            yield from records
+
+    def _read_shapefile(self, local, path, skip_fields, mtime, shapes=True):
+        """Yield shapefile records with their geometry as a GeoJSON mapping.
 
-    def _peek_shapefile(self, st, path):
-        yield from self._parse_shapefile(
-            st, path, set(), "wkt", datetime.now(timezone.utc)
+        Without `shapes` only the attribute table is read, geometries are null.
+        """
+        reader = shapefile.Reader(local)
+        # Selected fields keep the file order, the plan indexes into them
+        field_names = self._projected([f[0] for f in reader.fields[1:]])
+        expose_cols, feature_cols = self._field_plan(
+            range(len(field_names)), field_names, skip_fields
         )
 
+        # Identical for every feature of the file, shared by reference
+        metadata = {"source": path, "driver": "shapefile"}
+        basename = os.path.basename(path)
+
+        fields = field_names if self.project_only_exposed else None
+        if shapes:
+            rows = (
+                (sr.record, _shape_to_geojson(sr.shape))
+                for sr in reader.iterShapeRecords(fields=fields)
+            )
+        else:
+            rows = ((values, None) for values in reader.iterRecords(fields=fields))
+        for values, geometry in rows:
+            record = {col: values[i] for i, col in expose_cols}
+            record["geometry"] = geometry
+            record["features"] = {col: values[i] for i, col in feature_cols}
+            record["metadata"] = metadata
+            record[SDC_INCREMENTAL_KEY] = mtime
+            record[SDC_FILENAME] = basename
+            yield record
+
     def _parse_geojson(self, st, path, skip_fields, geom_fmt, mtime):
-        with self._staged_local_file(st, path) as local:
-            with open(local, "r", encoding="utf-8") as jf:
-                gj = json.load(jf)
-
-            features = gj.get("features") if "features" in gj else [gj]
-            for feat in features:
-                geom_obj = shapely.geometry.shape(feat["geometry"])
-                geom_out = to_wkt(geom_obj) if geom_fmt == "wkt" else feat["geometry"]
-                props = {
-                    k.lower(): v
-                    for k, v in (feat.get("properties") or {}).items()
-                    if k.lower() not in skip_fields
-                }
-                exposed = {
-                    k: props.pop(k) for k in list(self.expose_fields) if k in props
-                }
-                yield {
-                    **exposed,
-                    "geometry": geom_out,
-                    "features": props,
-                    "metadata": {"source": path, "driver": "geojson"},
-                    SDC_INCREMENTAL_KEY: mtime,
-                    SDC_FILENAME: os.path.basename(path),
-                }
+        with self._staged_local_file(st, path, mtime) as local:
+            gj = _load_json(local)
 
-    def _peek_geojson(self, st, path):
-        yield from self._parse_geojson(
-            st, path, set(), "wkt", datetime.now(timezone.utc)
-        )
+            records = self._read_geojson(gj, path, skip_fields, mtime)
+            if encode := GEOJSON_ENCODERS.get(geom_fmt):
+                records = _encode_geometries(records, encode, self._invalid_geometry)
+            yield from records
+
+    def _read_geojson(self, gj, path, skip_fields, mtime):
+        """Yield GeoJSON records with their geometry as a GeoJSON mapping."""
+        features = gj.get("features") if "features" in gj else [gj]
+        # Features usually share the same property keys, plan each layout once
+        plans: dict[tuple, tuple] = {}
+        get_plan = plans.get
+        metadata = {"source": path, "driver": "geojson"}
+        basename = os.path.basename(path)
+        for feat in features:
+            raw = feat.get("properties") or {}
+            keys = tuple(raw)
+            plan = get_plan(keys)
+            if plan is None:
+                names = self._projected(list(keys))
+                expose_cols, feature_cols = self._field_plan(names, names, skip_fields)
+                # Kept keys not renamed: `features` is a plain copy minus the
+                # few exposed or skipped keys, when those are the minority
+                drop = None
+                if all(k == col for k, col in feature_cols):
+                    kept = {k for k, _ in feature_cols}
+                    removed = tuple(k for k in keys if k not in kept)
+                    if len(removed) <= len(kept):
+                        drop = removed
+                plan = plans[keys] = (expose_cols, feature_cols, drop)
+            expose_cols, feature_cols, drop = plan
+            record = {col: raw[k] for k, col in expose_cols}
+            record["geometry"] = feat["geometry"]
+            if drop is None:
+                record["features"] = {col: raw[k] for k, col in feature_cols}
+            else:
+                record["features"] = props = dict(raw)
+                for k in drop:
+                    del props[k]
+            record["metadata"] = metadata
+            record[SDC_INCREMENTAL_KEY] = mtime
+            record[SDC_FILENAME] = basename
+            yield record
 
     def _parse_gpx(self, st, path, geom_fmt, mtime):
-        with self._staged_local_file(st, path) as local:
+        with self._staged_local_file(st, path, mtime) as local:
             with open(local, "r", encoding="utf-8") as gf:
                 gpx = gpxpy.parse(gf)
 
-            for wp in gpx.waypoints:
-                geom_obj = shapely.geometry.Point(wp.longitude, wp.latitude)
-                geom_out = (
-                    to_wkt(geom_obj)
-                    if geom_fmt == "wkt"
-                    else geom_obj.__geo_interface__
-                )
+            records = self._read_gpx(gpx, path, mtime)
+            if encode := GEOJSON_ENCODERS.get(geom_fmt):
+                records = _encode_geometries(records, encode, self._invalid_geometry)
+            yield from records
+
+    def _read_gpx(self, gpx, path, mtime):
+        """Yield GPX records with their geometry as a GeoJSON mapping."""
+        basename = os.path.basename(path)
+        metadata = {"source": path, "driver": "gpx_waypoint"}
+        for wp in gpx.waypoints:
+            yield {
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": (wp.longitude, wp.latitude),
+                },
+                "features": {
+                    "name": wp.name,
+                    "elevation": wp.elevation,
+                    "time": wp.time.isoformat() if wp.time else None,
+                },
+                "metadata": metadata,
+                SDC_INCREMENTAL_KEY: mtime,
+                SDC_FILENAME: basename,
+            }
+
+        metadata = {"source": path, "driver": "gpx_track"}
+        for track in gpx.tracks:
+            for segment in track.segments:
                 yield {
-                    "geometry": geom_out,
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": tuple(
+                            (pt.longitude, pt.latitude) for pt in segment.points
+                        ),
+                    },
                     "features": {
-                        "name": wp.name,
-                        "elevation": wp.elevation,
-                        "time": wp.time.isoformat() if wp.time else None,
+                        "name": track.name,
+                        "segment_index": getattr(segment, "index", None),
+                        "elevations": [pt.elevation for pt in segment.points],
                     },
-                    "metadata": {"source": path, "driver": "gpx_waypoint"},
+                    "metadata": metadata,
                     SDC_INCREMENTAL_KEY: mtime,
-                    SDC_FILENAME: os.path.basename(path),
+                    SDC_FILENAME: basename,
                 }
 
-            for track in gpx.tracks:
-                for segment in track.segments:
-                    coords = [(pt.longitude, pt.latitude) for pt in segment.points]
-                    geom_obj = shapely.geometry.LineString(coords)
-                    geom_out = (
-                        to_wkt(geom_obj)
-                        if geom_fmt == "wkt"
-                        else geom_obj.__geo_interface__
-                    )
-                    yield {
-                        "geometry": geom_out,
-                        "features": {
-                            "name": track.name,
-                            "segment_index": getattr(segment, "index", None),
-                            "elevations": [pt.elevation for pt in segment.points],
-                        },
-                        "metadata": {"source": path, "driver": "gpx_track"},
-                        SDC_INCREMENTAL_KEY: mtime,
-                        SDC_FILENAME: os.path.basename(path),
-                    }
-
-    def _peek_gpx(self, st, path):
-        yield from self._parse_gpx(st, path, "wkt", datetime.now(timezone.utc))
-
     def _parse_osm(self, st, path, geom_fmt, mtime):
-        with self._staged_local_file(st, path) as local:
-            handler = OSMHandler(geom_fmt)
-            handler.apply_file(local)
-            for rec in handler.records:
-                metadata = {"source": path}
-                tags = rec.pop("tags", {}) or {}
-                exposed = {
-                    k.lower(): tags.pop(k)
-                    for k in self.expose_fields
-                    if k in tags
-                    and k.lower() not in [*self.core_fields, "id", "type", "members"]
-                }
-                yield {
-                    **exposed,
-                    "id": rec.get("id"),
-                    "type": rec.get("type"),
-                    "members": rec.pop("members", None),
-                    "geometry": rec.get("geometry"),
-                    "features": tags,
-                    "metadata": metadata,
-                    SDC_INCREMENTAL_KEY: mtime,
-                    SDC_FILENAME: os.path.basename(path),
-                }
+        with self._staged_local_file(st, path, mtime) as local:
+            records = self._osm_records(local, path, mtime)
+            if encode := GEOJSON_ENCODERS.get(geom_fmt):
+                records = _encode_geometries(records, encode, self._invalid_geometry)
+            yield from records
+
+    def _osm_records(self, local, path, mtime):
+        """Yield OSM records with their geometry as a GeoJSON mapping."""
+        metadata = {"source": path}
+        basename = os.path.basename(path)
+        # Locals for the per-record loop
+        osm_expose_set = self._osm_expose_set
+        osm_expose = self._osm_expose
+        # Handler records always carry id, type, geometry and tags
+        records = self._read_osm(
+            local, self.osm_location_index, self.osm_tagged_nodes_only
+        )
+        for rec in records:
+            tags = rec["tags"]
+            record = {}
+            # Most tags are not exposed, test them against the set first
+            if not osm_expose_set.isdisjoint(tags):
+                for k in osm_expose:
+                    if (value := tags.pop(k, _MISSING)) is not _MISSING:
+                        record[k] = value
+            record["id"] = rec["id"]
+            record["type"] = rec["type"]
+            record["members"] = rec.get("members")
+            record["geometry"] = rec["geometry"]
+            record["features"] = tags
+            record["metadata"] = metadata
+            record[SDC_INCREMENTAL_KEY] = mtime
+            record[SDC_FILENAME] = basename
+            yield record
+
+    @staticmethod
+    def _read_osm(
+        local: str,
+        location_index: str | None = None,
+        tagged_nodes_only: bool = False,
+    ) -> t.Iterator[dict]:
+        """Yield OSM handler records while pyosmium reads the file in a thread.
+
+        Records go through a bounded queue, so memory stays flat whatever the
+        file size and the first records are emitted before the read completes.
+        With a `location_index`, node locations are stored in that pyosmium
+        index as they are read, giving ways their geometry in the same pass.
+        With `tagged_nodes_only`, nodes without tags are dropped by pyosmium
+        before reaching Python, their locations are still indexed.
+        """
+        filters: list[object] = []
+        if tagged_nodes_only:
+            empty_tags = osmium.filter.EmptyTagFilter()
+            empty_tags.enable_for(osmium.osm.NODE)
+            filters.append(empty_tags)
+        chunks: queue.Queue = queue.Queue(maxsize=OSM_QUEUE_SIZE // OSM_CHUNK_SIZE)
+        cancelled = threading.Event()
+        chunk: list[dict] = []
 
-    def _peek_osm(self, st, path):
-        yield from self._parse_osm(st, path, "wkt", datetime.now(timezone.utc))
+        def emit(rec: dict) -> None:
+            nonlocal chunk
+            chunk.append(rec)
+            if len(chunk) >= OSM_CHUNK_SIZE:
+                if not _put_unless_cancelled(chunks, chunk, cancelled):
+                    raise _ReadCancelled
+                chunk = []
+
+        def read() -> None:
+            try:
+                OSMHandler(emit).apply_file(
+                    local,
+                    locations=location_index is not None,
+                    idx=location_index or "flex_mem",
+                    filters=filters,
+                )
+                if chunk and not _put_unless_cancelled(chunks, chunk, cancelled):
+                    return
+                end: BaseException | None = None
+            except _ReadCancelled:
+                return
+            except BaseException as e:  # noqa: BLE001, re-raised by the consumer
+                end = e
+            _put_unless_cancelled(chunks, end, cancelled)
+
+        reader = threading.Thread(target=read, name="tap-geo-osm", daemon=True)
+        reader.start()
+        try:
+            while (item := chunks.get()) is not None:
+                if isinstance(item, BaseException):
+                    raise item
+                yield from item
+        finally:
+            cancelled.set()
+            reader.join()
 
     # -------------------------------------------------------------------------
     # GeoPackage (.gpkg)
     # -------------------------------------------------------------------------
     @staticmethod
-    def _gpkg_wkb_to_geom(blob: bytes) -> shapely.geometry.base.BaseGeometry | None:
-        """Parse a GPKG geometry blob (GPKG header + WKB) into a Shapely geometry."""
+    def _gpkg_wkb(blob: bytes) -> bytes | None:
+        """Strip the GPKG header from a geometry blob, returning the WKB."""
         if not blob or len(blob) < 8:
             return None
         # Magic bytes check
         if blob[0:2] != b"GP":
             return None
         flags = blob[3]
-        little_endian = bool(flags & 0x01)
         envelope_type = (flags >> 1) & 0x07
         is_empty = bool((flags >> 4) & 0x01)
         if is_empty:
@@ -418,64 +1072,141 @@ class GeoStream(Stream):
         envelope_sizes = {0: 0, 1: 32, 2: 48, 3: 48, 4: 64}
         envelope_bytes = envelope_sizes.get(envelope_type, 0)
         wkb_offset = 8 + envelope_bytes
-        wkb = blob[wkb_offset:]
-        return from_wkb(wkb)
+        return blob[wkb_offset:]
 
     def _parse_gpkg(self, st, path, skip_fields, geom_fmt, mtime):
-        with self._staged_local_file(st, path) as local:
+        with self._staged_local_file(st, path, mtime) as local:
             conn = sqlite3.connect(local)
             conn.row_factory = sqlite3.Row
             try:
-                layers = conn.execute(
-                    "SELECT table_name, column_name FROM gpkg_geometry_columns"
-                ).fetchall()
-                for layer_name, geom_col in layers:
-                    cols = conn.execute(
-                        f"PRAGMA table_info({layer_name})"  # noqa: S608
-                    ).fetchall()
-                    prop_cols = [
-                        c["name"]
-                        for c in cols
-                        if c["name"] != geom_col
-                    ]
-                    for row in conn.execute(
-                        f"SELECT {geom_col}, {', '.join(prop_cols)} FROM {layer_name}"  # noqa: S608
-                    ):
-                        geom_blob = row[0]
-                        geom_obj = self._gpkg_wkb_to_geom(geom_blob)
-                        if geom_obj is None:
-                            continue
-                        geom_out = (
-                            to_wkt(geom_obj)
-                            if geom_fmt == "wkt"
-                            else geom_obj.__geo_interface__
-                        )
-                        props = {
-                            c.lower(): row[c]
-                            for c in prop_cols
-                            if c.lower() not in skip_fields
-                        }
-                        exposed = {
-                            k: props.pop(k)
-                            for k in list(self.expose_fields)
-                            if k in props
-                        }
-                        yield {
-                            **exposed,
-                            "geometry": geom_out,
-                            "features": props,
-                            "metadata": {
-                                "source": path,
-                                "driver": "gpkg",
-                                "layer": layer_name,
-                            },
-                            SDC_INCREMENTAL_KEY: mtime,
-                            SDC_FILENAME: os.path.basename(path),
-                        }
+                records = self._read_gpkg(conn, path, skip_fields, mtime)
+                yield from _encode_geometries(
+                    records,
+                    WKB_ENCODERS.get(geom_fmt, _wkb_to_geojson),
+                    self._invalid_geometry,
+                )
             finally:
                 conn.close()
 
-    def _peek_gpkg(self, st, path):
-        yield from self._parse_gpkg(
-            st, path, set(), "wkt", datetime.now(timezone.utc)
-        )
+    def _read_gpkg(self, conn, path, skip_fields, mtime):
+        """Yield GeoPackage records with their geometry as WKB."""
+        layers = conn.execute(
+            "SELECT table_name, column_name FROM gpkg_geometry_columns"
+        ).fetchall()
+        basename = os.path.basename(path)
+        for layer_name, geom_col in layers:
+            cols = conn.execute(
+                f"PRAGMA table_info({layer_name})"  # noqa: S608
+            ).fetchall()
+            prop_cols = self._projected(
+                [c["name"] for c in cols if c["name"] != geom_col]
+            )
+            # Row values follow the SELECT order, geometry first
+            expose_cols, feature_cols = self._field_plan(
+                range(1, len(prop_cols) + 1), prop_cols, skip_fields
+            )
+            metadata = {"source": path, "driver": "gpkg", "layer": layer_name}
+            select = ", ".join([geom_col, *prop_cols])
+            for row in conn.execute(
+                f"SELECT {select} FROM {layer_name}"  # noqa: S608
+            ):
+                wkb = self._gpkg_wkb(row[0])
+                if wkb is None:
+                    continue
+                record = {col: row[i] for i, col in expose_cols}
+                record["geometry"] = wkb
+                record["features"] = {col: row[i] for i, col in feature_cols}
+                record["metadata"] = metadata
+                record[SDC_INCREMENTAL_KEY] = mtime
+                record[SDC_FILENAME] = basename
+                yield record
+
+    # -------------------------------------------------------------------------
+    # GDAL formats through pyogrio (engine=pyogrio)
+    # -------------------------------------------------------------------------
+    def _parse_ogr(
+        self, st, path, skip_fields, geom_fmt, mtime, batch_size=OGR_BATCH_SIZE
+    ):
+        if not HAS_PYOGRIO:
+            raise RuntimeError(
+                "engine 'pyogrio' requires the optional dependencies, "
+                "install tap-geo[pyogrio]"
+            )
+        with self._ogr_source(st, path, mtime) as source:
+            records = self._read_ogr(source, path, skip_fields, mtime, batch_size)
+            yield from _encode_geometries(
+                records,
+                WKB_ENCODERS.get(geom_fmt, _wkb_to_geojson),
+                self._invalid_geometry,
+            )
+
+    @contextmanager
+    def _ogr_source(self, st: Storage, path: str, mtime: datetime):
+        """Yield the path GDAL opens: a VSI path with read_in_place, else local."""
+        vsi = st.vsi_path(path) if self.read_in_place else None
+        if vsi is None:
+            with self._staged_local_file(st, path, mtime) as local:
+                yield local
+            return
+
+        pyogrio.set_gdal_config_options({**VSI_GDAL_OPTIONS, **st.gdal_options()})
+        yield vsi
+
+    def _read_ogr(self, local, path, skip_fields, mtime, batch_size=OGR_BATCH_SIZE):
+        """Yield records of every geometry layer, streamed as Arrow batches."""
+        driver = OGR_DRIVERS[Path(path).suffix.lower()]
+        basename = os.path.basename(path)
+        for layer, fields in self._ogr_layout(local, path, mtime):
+            columns = [
+                f for f in self._projected(fields) if f.lower() not in skip_fields
+            ]
+            # GeoPackage exposes its primary key, as the native reader does
+            return_fids = driver == "gpkg" and bool(self._projected(["fid"]))
+            metadata = {"source": path, "driver": driver}
+            if driver == "gpkg":
+                metadata["layer"] = layer
+            # Stream the layer, only one Arrow batch is decoded at a time
+            with pyogrio.raw.open_arrow(
+                local,
+                layer=layer,
+                columns=columns,
+                return_fids=return_fids,
+                batch_size=batch_size,
+                use_pyarrow=True,
+            ) as (meta, reader):
+                geom_col = meta.get("geometry_name") or "wkb_geometry"
+                names = [c for c in reader.schema.names if c != geom_col]
+                expose_cols, feature_cols = self._field_plan(names, names, skip_fields)
+
+                for batch in reader:
+                    data = {name: batch.column(name).to_pylist() for name in names}
+                    geoms = batch.column(geom_col).to_pylist()
+                    # Column lists resolved once per batch, not per row
+                    exposed = [(data[k], col) for k, col in expose_cols]
+                    features = [(data[k], col) for k, col in feature_cols]
+                    for i, geom in enumerate(geoms):
+                        record = {col: values[i] for values, col in exposed}
+                        record["geometry"] = geom
+                        record["features"] = {
+                            col: values[i] for values, col in features
+                        }
+                        record["metadata"] = metadata
+                        record[SDC_INCREMENTAL_KEY] = mtime
+                        record[SDC_FILENAME] = basename
+                        yield record
+
+    def _ogr_layout(self, local, path, mtime) -> list[tuple[str, list[str]]]:
+        """Return `(layer, fields)` of the geometry layers, read once per file.
+
+        The schema peek and the sync open the same dataset, only the first one
+        reads the layer headers.
+        """
+        key = (path, mtime)
+        layout = self._ogr_layout_cache.get(key)
+        if layout is None:
+            layout = self._ogr_layout_cache[key] = [
+                (name, list(pyogrio.read_info(local, layer=name)["fields"]))
+                for name, geometry_type in pyogrio.list_layers(local)
+                if geometry_type is not None
+            ]
+        return layout
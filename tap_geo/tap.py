@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 from singer_sdk import Tap, typing as th
 
 from tap_geo.streams import GeoStream
 from tap_geo.storage import Storage
+from tap_geo.writer import GeoSingerWriter
+
+# Patterns expanded concurrently during discovery
+GLOB_WORKERS = 8
 
 
 class TapGeo(Tap):
     """Singer tap for geospatial files."""
 
     name = "tap-geo"
+    message_writer_class = GeoSingerWriter
 
     config_jsonschema = th.PropertiesList(
         th.Property(
@@ -20,15 +27,67 @@ class TapGeo(Tap):
                 th.ObjectType(
                     th.Property("paths", th.ArrayType(th.StringType), required=True),
                     th.Property("table_name", th.StringType),
-                    th.Property("skip_fields", th.ArrayType(th.StringType), default=[]),
+                    th.Property(
+                        "skip_fields",
+                        th.ArrayType(th.StringType),
+                        description="Properties to drop. Defaults to the "
+                        "tap-level `skip_fields`",
+                    ),
                     th.Property(
                         "primary_keys", th.ArrayType(th.StringType), default=[]
                     ),
                     th.Property(
                         "geometry_format",
                         th.StringType,
-                        default="wkt",
-                        description="Geometry format: wkt or geojson",
+                        description="Geometry format: wkt, geojson or geojson_str "
+                        "(GeoJSON serialized as a string). Defaults to the "
+                        "tap-level `geometry_format`, else wkt",
+                    ),
+                    th.Property(
+                        "skip_geometry",
+                        th.BooleanType,
+                        default=False,
+                        description="Emit null geometries without decoding them, "
+                        "for targets that only need the attributes",
+                    ),
+                    th.Property(
+                        "project_only_exposed",
+                        th.BooleanType,
+                        default=False,
+                        description="Read only the `expose_fields` columns from the "
+                        "source, leaving `features` empty",
+                    ),
+                    th.Property(
+                        "engine",
+                        th.StringType,
+                        default="native",
+                        allowed_values=["native", "pyogrio"],
+                        description="Reader for SHP, GeoJSON and GPKG files: native "
+                        "(pure Python readers) or pyogrio (GDAL, requires the "
+                        "`pyogrio` extra)",
+                    ),
+                    th.Property(
+                        "read_in_place",
+                        th.BooleanType,
+                        default=False,
+                        description="With engine pyogrio, read remote S3, GCS or "
+                        "HTTP files through GDAL range requests instead of "
+                        "downloading them to the cache first",
+                    ),
+                    th.Property(
+                        "osm_location_index",
+                        th.StringType,
+                        description="pyosmium node location index used to build "
+                        "way geometries, e.g. flex_mem, or "
+                        "sparse_file_array,<path> for files larger than RAM. "
+                        "Unset, ways have a null geometry",
+                    ),
+                    th.Property(
+                        "osm_tagged_nodes_only",
+                        th.BooleanType,
+                        default=False,
+                        description="For OSM/PBF files, skip nodes without tags "
+                        "(way vertices) inside pyosmium, before records are built",
                     ),
                     th.Property(
                         "expose_fields",
@@ -42,16 +101,51 @@ class TapGeo(Tap):
             required=True,
             description="List of file configs to parse",
         ),
+        th.Property(
+            "skip_fields",
+            th.ArrayType(th.StringType),
+            default=[],
+            description="Properties to drop, for files not setting their own",
+        ),
+        th.Property(
+            "geometry_format",
+            th.StringType,
+            default="wkt",
+            description="Geometry format: wkt, geojson or geojson_str (GeoJSON "
+            "serialized as a string), for files not setting their own",
+        ),
+        th.Property(
+            "cache_dir",
+            th.StringType,
+            description="Directory where remote files are cached between runs. "
+            "Unset, remote files are downloaded to a temporary directory on "
+            "every run.",
+        ),
+        th.Property(
+            "parse_parallelism",
+            th.IntegerType,
+            default=1,
+            description="Number of files parsed concurrently, reading the files "
+            "of the next streams ahead too. Records are still emitted stream by "
+            "stream and file by file, in order.",
+        ),
     ).to_dict()
 
     def discover_streams(self):
+        files = self.config["files"]
+        patterns = [pattern for file_cfg in files for pattern in file_cfg["paths"]]
+        # Listing is I/O bound (directory walks, remote LIST calls), run it
+        # for all patterns at once
+        with ThreadPoolExecutor(max_workers=GLOB_WORKERS) as pool:
+            matches = iter(list(pool.map(lambda p: Storage(p).glob(), patterns)))
+
         streams = []
-        for file_cfg in self.config["files"]:
-            all_paths = []
-            for pattern in file_cfg["paths"]:
-                st = Storage(pattern)
-                all_paths.extend(st.glob())
-            cfg = {**file_cfg, "paths": all_paths}
+        for file_cfg in files:
+            # Overlapping patterns must not parse the same file twice
+            all_paths: dict[str, None] = {}
+            for _ in file_cfg["paths"]:
+                all_paths.update(dict.fromkeys(next(matches)))
+            cfg = {**file_cfg, "paths": list(all_paths)}
             streams.append(GeoStream(self, cfg))
         return streams
 
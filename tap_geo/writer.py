@@ -0,0 +1,82 @@
+"""Singer message writer buffering stdout writes between STATE messages."""
+
+from __future__ import annotations
+
+import sys
+import typing as t
+import weakref
+
+from singer_sdk.io_base import SingerMessageType, SingerWriter
+
+from .optional import HAS_ORJSON
+
+if HAS_ORJSON:
+    import orjson
+
+if t.TYPE_CHECKING:
+    from singer_sdk.singerlib.messages import Message
+
+# Serialized messages held before a write to stdout
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+
+
+class GeoSingerWriter(SingerWriter):
+    """Write Singer messages in large chunks instead of one flush per line.
+
+    Messages are flushed whenever a STATE message is written, so targets never
+    see a bookmark ahead of its records. With orjson installed messages are
+    serialized by it, falling back to the SDK encoder for values it does not
+    support (decimals, integers beyond 64 bits, non-string keys, ...).
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pending: list[bytes] = []
+        self._pending_size = 0
+        # Messages left after the last STATE (e.g. SCHEMA only runs) are
+        # written when the writer goes away or the interpreter exits
+        weakref.finalize(self, _write_out, self._pending)
+
+    def serialize_message(self, message: Message) -> str:
+        """Serialize a message into a line of json."""
+        return self._encode(message).decode()
+
+    def write_message(self, message: Message) -> None:
+        """Buffer a message, writing the buffer out on STATE or when full."""
+        line = self._encode(message) + b"\n"
+        self._pending.append(line)
+        self._pending_size += len(line)
+        if (
+            message.type == SingerMessageType.STATE
+            or self._pending_size >= WRITE_BUFFER_SIZE
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered messages to stdout."""
+        _write_out(self._pending)
+        self._pending_size = 0
+
+    def _encode(self, message: Message) -> bytes:
+        if HAS_ORJSON:
+            try:
+                return orjson.dumps(message.to_dict())
+            except TypeError:
+                pass
+        return super().serialize_message(message).encode()
+
+
+def _write_out(pending: list[bytes]) -> None:
+    """Write and clear a list of serialized messages, in one stdout write."""
+    if not pending:
+        return
+    data = b"".join(pending)
+    pending.clear()
+    out = sys.stdout
+    out.flush()
+    if (buffer := getattr(out, "buffer", None)) is not None:
+        buffer.write(data)
+        buffer.flush()
+    else:  # replaced by a text-only stream
+        out.write(data.decode())
+        out.flush()
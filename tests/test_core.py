@@ -1,7 +1,20 @@
+import json
 import os
+import threading
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import fsspec
 import pytest
+import shapefile
+from singer_sdk.singerlib.messages import RecordMessage, StateMessage
+
+import tap_geo.streams as streams
+from tap_geo.storage import Storage
+from tap_geo.streams import GeoStream, _schema_type
 from tap_geo.tap import TapGeo
-from tap_geo.streams import GeoStream
+from tap_geo.writer import GeoSingerWriter
 
 BASE = "data"
 
@@ -60,3 +73,563 @@ def test_tapgeo_discovers_streams():
         assert "properties" in schema
         recs = list(stream.get_records(context=None))
         assert len(recs) > 0
+
+
+def test_remote_shapefile_is_staged_with_sidecars(tmp_path):
+    """Ensure a shapefile on a remote storage is staged with its sidecars."""
+    fs = fsspec.filesystem("memory")
+    for ext in (".shp", ".shx", ".dbf", ".prj"):
+        fs.pipe(f"/remote/stazioni{ext}", Path(f"{BASE}/stazioni{ext}").read_bytes())
+
+    cfg = {"paths": ["memory://remote/*.shp"], "table_name": "stazioni"}
+    tap = TapGeo(config={"files": [cfg], "cache_dir": str(tmp_path)})
+    stream = GeoStream(tap, cfg)
+
+    local_cfg = {"paths": [os.path.join(BASE, "stazioni.shp")]}
+    local = list(GeoStream(tap, local_cfg).get_records(context=None))
+    remote = list(stream.get_records(context=None))
+    assert [r["geometry"] for r in remote] == [r["geometry"] for r in local]
+
+
+def test_incomplete_remote_shapefile_is_not_cached(tmp_path):
+    """Ensure a bundle listed before its .dbf is uploaded is fetched again."""
+    fs = fsspec.filesystem("memory")
+    for ext in (".shp", ".shx", ".prj"):
+        fs.pipe(f"/late/stazioni{ext}", Path(f"{BASE}/stazioni{ext}").read_bytes())
+
+    # Discovery would stage the incomplete bundle, build the stream by hand
+    local_cfg = {"paths": [os.path.join(BASE, "test.geojson")]}
+    tap = TapGeo(config={"files": [local_cfg], "cache_dir": str(tmp_path)})
+    stream = GeoStream(tap, {"paths": ["memory://late/*.shp"]})
+    st = stream.storages[0]
+    path, mtime = st.glob()[0], datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+    with pytest.raises(FileNotFoundError):
+        with stream._staged_local_file(st, path, mtime):
+            pass
+    assert not list(tmp_path.glob("*/*/.complete"))
+
+    fs.pipe("/late/stazioni.dbf", Path(f"{BASE}/stazioni.dbf").read_bytes())
+    with stream._staged_local_file(st, path, mtime) as local:
+        assert len(shapefile.Reader(local).records()) > 0
+
+
+def test_remote_files_are_cached_by_mtime(tmp_path):
+    """Ensure a remote file is downloaded once and reused from the cache."""
+    fs = fsspec.filesystem("memory")
+    fs.pipe("/cached/test.geojson", Path(f"{BASE}/test.geojson").read_bytes())
+
+    cfg = {"paths": ["memory://cached/test.geojson"]}
+    tap = TapGeo(config={"files": [cfg], "cache_dir": str(tmp_path)})
+    stream = GeoStream(tap, cfg)
+    first = list(stream.get_records(context=None))
+
+    cached = list(tmp_path.glob("*/*/test.geojson"))
+    assert len(cached) == 1
+
+    # The remote copy is gone, the cached one is served for the same mtime
+    st = stream.storages[0]
+    path, mtime = st.glob()[0], first[0]["_sdc_last_modified"]
+    fs.rm("/cached/test.geojson")
+    with stream._staged_local_file(st, path, mtime) as local:
+        assert local == str(cached[0])
+
+
+def test_remote_files_are_not_cached_without_cache_dir(tmp_path, monkeypatch):
+    """Ensure remote files go to a temporary directory unless cache_dir is set."""
+    fs = fsspec.filesystem("memory")
+    fs.pipe("/uncached/test.geojson", Path(f"{BASE}/test.geojson").read_bytes())
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    cfg = {"paths": ["memory://uncached/test.geojson"]}
+    stream = GeoStream(TapGeo(config={"files": [cfg]}), cfg)
+    st = stream.storages[0]
+    path, mtime = st.glob()[0], st.describe(st.glob()[0]).mtime
+    with stream._staged_local_file(st, path, mtime) as local:
+        assert os.path.exists(local)
+    assert not os.path.exists(local)
+    assert not list(tmp_path.iterdir())
+
+
+def test_cache_prunes_staging_left_by_crashed_runs(tmp_path):
+    """Ensure old staging dirs are removed, recent ones may still be in use."""
+    fs = fsspec.filesystem("memory")
+    fs.pipe("/crashed/test.geojson", Path(f"{BASE}/test.geojson").read_bytes())
+
+    cfg = {"paths": ["memory://crashed/test.geojson"]}
+    stream = GeoStream(TapGeo(config={"files": [cfg], "cache_dir": str(tmp_path)}), cfg)
+    st = stream.storages[0]
+    path = st.glob()[0]
+    entry = GeoStream._cache_entry(str(tmp_path), path, st.describe(path).mtime)
+    crashed, running = entry.parent / "1500000000.abc", entry.parent / "1600000000.def"
+    crashed.mkdir(parents=True)
+    running.mkdir()
+    os.utime(crashed, (1_500_000_000, 1_500_000_000))
+
+    stream._populate_cache_entry(st, path, entry)
+    assert {p.name for p in entry.parent.iterdir()} == {entry.name, running.name}
+
+
+def test_schema_is_computed_once(monkeypatch):
+    """Ensure repeated schema access does not probe the files again."""
+    cfg = {"paths": [os.path.join(BASE, "test.geojson")]}
+    tap = TapGeo(config={"files": [cfg]})
+    stream = GeoStream(tap, cfg)
+    schema = stream.schema
+
+    def fail(*args, **kwargs):
+        raise AssertionError("schema probed twice")
+
+    monkeypatch.setattr(stream, "_parse_geojson", fail)
+    assert stream.schema is schema
+
+
+@pytest.mark.parametrize("geometry_format", ["wkt", "geojson"])
+def test_pyogrio_engine_matches_native_reader(tmp_path, geometry_format):
+    """Ensure the pyogrio engine yields the same records, null geometries too."""
+    pytest.importorskip("pyogrio")
+    pytest.importorskip("pyarrow")
+
+    point = {"type": "Point", "coordinates": [11.0, 46.0]}
+    features = [
+        {"type": "Feature", "properties": {"n": n}, "geometry": geometry}
+        for n, geometry in enumerate([point, None])
+    ]
+    nulls = tmp_path / "nulls.geojson"
+    nulls.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+
+    for path in (os.path.join(BASE, "stazioni.shp"), str(nulls)):
+        records = {}
+        for engine in ("native", "pyogrio"):
+            cfg = {
+                "paths": [path],
+                "engine": engine,
+                "expose_fields": ["nome"],
+                "geometry_format": geometry_format,
+            }
+            tap = TapGeo(config={"files": [cfg]})
+            stream_records = list(GeoStream(tap, cfg).get_records(context=None))
+            # GEOS mappings hold tuples where the native readers hold lists
+            records[engine] = json.loads(json.dumps(stream_records, default=str))
+
+        assert records["pyogrio"] == records["native"]
+
+
+def test_project_only_exposed_fields():
+    """Ensure only exposed columns are read when projection is enabled."""
+    cfg = {
+        "paths": [os.path.join(BASE, "stazioni.shp")],
+        "expose_fields": ["nome"],
+        "project_only_exposed": True,
+    }
+    tap = TapGeo(config={"files": [cfg]})
+    records = list(GeoStream(tap, cfg).get_records(context=None))
+
+    assert records
+    for rec in records:
+        assert rec["nome"]
+        assert rec["features"] == {}
+
+
+def test_remote_osm_matches_local(tmp_path):
+    """Ensure a remote OSM file parses like the local one once cached."""
+    fs = fsspec.filesystem("memory")
+    fs.pipe("/streamed/test.osm", Path(f"{BASE}/test.osm").read_bytes())
+
+    cfg = {"paths": ["memory://streamed/test.osm"]}
+    tap = TapGeo(config={"files": [cfg], "cache_dir": str(tmp_path)})
+    remote = list(GeoStream(tap, cfg).get_records(context=None))
+
+    local_cfg = {"paths": [os.path.join(BASE, "test.osm")]}
+    local = list(GeoStream(tap, local_cfg).get_records(context=None))
+
+    assert [r["id"] for r in remote] == [r["id"] for r in local]
+    assert len(list(tmp_path.glob("*/*/test.osm"))) == 1
+
+
+def test_files_older_than_bookmark_are_skipped():
+    """Ensure files whose mtime is not newer than the bookmark are skipped."""
+    cfg = {"paths": [os.path.join(BASE, "test.geojson")]}
+    tap = TapGeo(config={"files": [cfg]})
+    stream = GeoStream(tap, cfg)
+    stream.get_starting_replication_key_value = lambda ctx: "2999-01-01T00:00:00"
+
+    assert list(stream.get_records(context=None)) == []
+    assert list(stream._bookmark_cache) == ["2999-01-01T00:00:00"]
+
+
+def test_parse_parallelism_keeps_file_order():
+    """Ensure concurrent parsing emits the same records in the same order."""
+    names = ["stazioni.shp", "test.geojson", "test.gpx"]
+    cfg = {"paths": [os.path.join(BASE, name) for name in names]}
+    serial = list(GeoStream(TapGeo(config={"files": [cfg]}), cfg).get_records(None))
+    assert list(dict.fromkeys(r["_sdc_filename"] for r in serial)) == names
+
+    tap = TapGeo(config={"files": [cfg], "parse_parallelism": 3})
+    assert list(GeoStream(tap, cfg).get_records(None)) == serial
+
+
+def test_parse_parallelism_reads_next_streams_ahead(capsys):
+    """Ensure reading the next streams ahead keeps records and final state."""
+    files = [
+        {"paths": [os.path.join(BASE, name)], "table_name": name.split(".")[1]}
+        for name in ("test.geojson", "stazioni.shp", "test.gpx")
+    ]
+
+    def sync(parallelism):
+        TapGeo(config={"files": files, "parse_parallelism": parallelism}).sync_all()
+        messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        records = [
+            (m["stream"], m["record"]) for m in messages if m["type"] == "RECORD"
+        ]
+        return records, [m for m in messages if m["type"] == "STATE"][-1]
+
+    assert sync(3) == sync(1)
+
+
+def test_parse_parallelism_skips_bookmarked_files(monkeypatch):
+    """Ensure files not newer than their bookmark are never parsed ahead."""
+    files = [
+        {"paths": [os.path.join(BASE, name)], "table_name": name.split(".")[1]}
+        for name in ("test.geojson", "test.gpx")
+    ]
+    bookmarks = {
+        cfg["table_name"]: {
+            "partitions": [
+                {
+                    "context": {"_sdc_filename": os.path.basename(cfg["paths"][0])},
+                    "starting_replication_value": "2999-01-01T00:00:00",
+                }
+            ]
+        }
+        for cfg in files
+    }
+    tap = TapGeo(
+        config={"files": files, "parse_parallelism": 2},
+        state={"bookmarks": bookmarks},
+    )
+    parsed = []
+    for name in ("_parse_geojson", "_parse_gpx"):
+        monkeypatch.setattr(GeoStream, name, lambda self, *a: parsed.append(a))
+
+    assert list(tap.streams["geojson"].get_records(None)) == []
+    assert list(tap.streams["gpx"].get_records(None)) == []
+    assert parsed == []
+    assert tap.state["bookmarks"] == bookmarks
+
+
+def test_osm_exposed_tags_skip_reserved_columns():
+    """Ensure OSM tags are exposed, except those clashing with OSM columns."""
+    cfg = {
+        "paths": [os.path.join(BASE, "test.osm")],
+        "expose_fields": ["name", "type"],
+    }
+    tap = TapGeo(config={"files": [cfg]})
+    records = list(GeoStream(tap, cfg).get_records(context=None))
+
+    named = [r for r in records if "name" in r]
+    assert named
+    assert all("name" not in r["features"] for r in named)
+    assert all(r["type"] in ("node", "way", "relation") for r in records)
+
+
+def test_osm_location_index_builds_way_geometries():
+    """Ensure ways get a LineString once node locations are indexed."""
+    cfg = {"paths": [os.path.join(BASE, "test.osm")]}
+    tap = TapGeo(config={"files": [cfg]})
+
+    def ways(file_cfg):
+        records = GeoStream(tap, file_cfg).get_records(context=None)
+        return [r for r in records if r["type"] == "way"]
+
+    assert all(r["geometry"] is None for r in ways(cfg))
+    indexed = ways({**cfg, "osm_location_index": "flex_mem"})
+    assert indexed
+    assert all(r["geometry"].startswith("LINESTRING") for r in indexed)
+
+
+def test_osm_way_cut_by_extract_has_no_geometry(tmp_path):
+    """Ensure a way left with a single located node gets a null geometry."""
+    path = tmp_path / "cut.osm"
+    path.write_text(
+        '<osm version="0.6">'
+        '<node id="1" lat="46.05" lon="11.45"/>'
+        '<way id="10"><nd ref="1"/><nd ref="2"/><tag k="highway" v="path"/></way>'
+        "</osm>"
+    )
+    cfg = {"paths": [str(path)], "osm_location_index": "flex_mem"}
+    tap = TapGeo(config={"files": [cfg]})
+    records = list(GeoStream(tap, cfg).get_records(context=None))
+
+    assert [r["type"] for r in records] == ["node", "way"]
+    assert records[1]["geometry"] is None
+
+
+def test_osm_tagged_nodes_only_keeps_way_geometries():
+    """Ensure untagged nodes are dropped while ways keep their locations."""
+    cfg = {
+        "paths": [os.path.join(BASE, "test.osm")],
+        "osm_location_index": "flex_mem",
+    }
+    tap = TapGeo(config={"files": [cfg]})
+    full = list(GeoStream(tap, cfg).get_records(context=None))
+    cfg = {**cfg, "osm_tagged_nodes_only": True}
+    tagged = list(GeoStream(tap, cfg).get_records(context=None))
+
+    assert [r for r in full if r["type"] != "node" or r["features"]] == tagged
+    assert any(r["type"] == "way" and r["geometry"] for r in tagged)
+
+
+def test_osm_reader_stops_when_closed_early(monkeypatch):
+    """Ensure closing the OSM record generator stops the pyosmium thread."""
+    monkeypatch.setattr(streams, "OSM_CHUNK_SIZE", 1)
+    monkeypatch.setattr(streams, "OSM_QUEUE_SIZE", 2)
+
+    records = GeoStream._read_osm(os.path.join(BASE, "test.osm"))
+    assert next(records)["type"] == "node"
+    records.close()
+
+    assert not [t for t in threading.enumerate() if t.name == "tap-geo-osm"]
+
+
+@pytest.mark.parametrize(
+    "filename", ["stazioni.shp", "test.geojson", "test.gpx", "test.osm"]
+)
+def test_geojson_str_matches_geojson(filename):
+    """Ensure geojson_str geometries are the serialized geojson ones."""
+
+    def geometries(fmt):
+        cfg = {"paths": [os.path.join(BASE, filename)], "geometry_format": fmt}
+        tap = TapGeo(config={"files": [cfg]})
+        return [r["geometry"] for r in GeoStream(tap, cfg).get_records(context=None)]
+
+    as_str = geometries("geojson_str")
+    assert all(g is None or isinstance(g, str) for g in as_str)
+    assert [json.loads(g) if g else None for g in as_str] == [
+        json.loads(json.dumps(g)) if g else None for g in geometries("geojson")
+    ]
+
+
+def test_invalid_geometries_are_skipped(tmp_path, caplog):
+    """Ensure a feature with a broken geometry is dropped, not the whole file."""
+    point = {"type": "Point", "coordinates": [11.0, 46.0]}
+    features = [
+        {"type": "Feature", "properties": {"n": n}, "geometry": geometry}
+        for n, geometry in enumerate([point, {"type": "Bogus"}, point])
+    ]
+    path = tmp_path / "broken.geojson"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+
+    cfg = {"paths": [str(path)]}
+    tap = TapGeo(config={"files": [cfg]})
+    records = list(GeoStream(tap, cfg).get_records(context=None))
+
+    assert [r["features"]["n"] for r in records] == [0, 2]
+    assert all(r["geometry"].startswith("POINT") for r in records)
+    # The schema peek at the file does not log it a second time
+    assert caplog.text.count("invalid geometry") == 1
+
+
+@pytest.mark.parametrize("geometry_format", ["wkt", "geojson"])
+def test_shapefile_null_shapes_have_no_geometry(tmp_path, geometry_format):
+    """Ensure NULL shapes are read as a null geometry, not an error."""
+    with shapefile.Writer(str(tmp_path / "nulls")) as w:
+        w.field("n", "N")
+        for n in range(3):
+            if n == 1:
+                w.null()
+            else:
+                w.point(11.0 + n, 46.0)
+            w.record(n)
+
+    cfg = {"paths": [str(tmp_path / "nulls.shp")], "geometry_format": geometry_format}
+    tap = TapGeo(config={"files": [cfg]})
+    records = list(GeoStream(tap, cfg).get_records(context=None))
+
+    assert [r["features"]["n"] for r in records] == [0, 1, 2]
+    assert records[1]["geometry"] is None
+    assert records[0]["geometry"] is not None and records[2]["geometry"] is not None
+
+
+def test_geojson_big_integers_keep_precision(tmp_path):
+    """Ensure integers beyond 64 bits are not rounded through floats."""
+    values = [2**64, -(2**63) - 1, 2**70 + 1]
+    features = [
+        {"type": "Feature", "properties": {"id": v}, "geometry": None} for v in values
+    ]
+    path = tmp_path / "ids.geojson"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+
+    cfg = {"paths": [str(path)]}
+    tap = TapGeo(config={"files": [cfg]})
+    records = list(GeoStream(tap, cfg).get_records(context=None))
+
+    assert [r["features"]["id"] for r in records] == values
+
+
+def test_per_file_skip_fields():
+    """Ensure skip_fields set on a file config drops those properties."""
+    cfg = {"paths": [os.path.join(BASE, "test.geojson")], "skip_fields": ["@id"]}
+    tap = TapGeo(config={"files": [cfg]})
+    records = list(GeoStream(tap, cfg).get_records(context=None))
+
+    assert records
+    assert all("@id" not in r["features"] for r in records)
+
+
+def test_file_settings_fall_back_to_tap_level():
+    """Ensure unset file settings use the tap-level skip_fields and format."""
+    files = [{"paths": [os.path.join(BASE, "test.geojson")]}]
+    tap = TapGeo(
+        config={"files": files, "skip_fields": ["@id"], "geometry_format": "geojson"}
+    )
+    records = list(tap.streams["test"].get_records(context=None))
+
+    assert records
+    assert all("@id" not in r["features"] for r in records)
+    assert all(isinstance(r["geometry"], dict) for r in records)
+    # Declared, so --about and config validation know about them
+    declared = TapGeo.config_jsonschema["properties"]
+    assert declared["skip_fields"]["default"] == []
+    assert declared["geometry_format"]["default"] == "wkt"
+
+
+@pytest.mark.parametrize("name", ["stazioni.shp", "test.geojson", "test.osm"])
+def test_skip_geometry_keeps_attributes(name):
+    """Ensure skip_geometry nulls geometries and leaves the rest untouched."""
+    cfg = {"paths": [os.path.join(BASE, name)]}
+    tap = TapGeo(config={"files": [cfg]})
+    expected = list(GeoStream(tap, cfg).get_records(context=None))
+    records = list(
+        GeoStream(tap, {**cfg, "skip_geometry": True}).get_records(context=None)
+    )
+
+    assert all(r["geometry"] is None for r in records)
+    assert [r["features"] for r in records] == [r["features"] for r in expected]
+
+
+def test_glob_detailed_uses_listing_metadata(monkeypatch):
+    """Ensure listed mtimes are used without describing each file again."""
+    st = Storage(os.path.join(BASE, "*.geojson"))
+    expected = [st.describe(p) for p in st.glob()]
+
+    info = st.fs.info
+    described = []
+    monkeypatch.setattr(st.fs, "info", lambda p: described.append(p) or info(p))
+
+    assert st.glob_detailed() == expected
+    assert not set(described) & {i.path for i in expected}
+
+
+def test_shapefile_mtime_lists_the_bundle_once(tmp_path, monkeypatch):
+    """Ensure the newest component mtime comes from one listing."""
+    for ext in (".shp", ".shx", ".dbf", ".prj"):
+        (tmp_path / f"stazioni{ext}").write_bytes(b"")
+    (tmp_path / "stazioni.txt").write_bytes(b"")
+    os.utime(tmp_path / "stazioni.dbf", (2_000_000_000, 2_000_000_000))
+    os.utime(tmp_path / "stazioni.txt", (3_000_000_000, 3_000_000_000))
+
+    st = Storage(str(tmp_path / "*.shp"))
+    path = st.glob()[0]
+    mtime = st.describe(path).mtime
+    monkeypatch.setattr(st, "describe", lambda p: pytest.fail(f"described {p}"))
+
+    newest = GeoStream._shapefile_mtime(st, path, mtime)
+    assert newest.timestamp() == 2_000_000_000
+
+
+def test_file_info_keeps_zero_size_and_epoch_mtime():
+    """Ensure falsy sizes and mtimes are kept instead of falling back."""
+    st = Storage(os.path.join(BASE, "*.geojson"))
+    info = st._file_info("empty.geojson", {"size": 0, "Size": 7, "mtime": 0})
+
+    assert info.size == 0
+    assert info.mtime.timestamp() == 0
+
+
+def test_vsi_paths_for_remote_storages():
+    """Ensure remote URLs map to the GDAL virtual file systems."""
+    st = Storage(os.path.join(BASE, "*.geojson"))
+    assert st.vsi_path("s3://bucket/dir/a.gpkg") == "/vsis3/bucket/dir/a.gpkg"
+    assert st.vsi_path("gs://bucket/a.gpkg") == "/vsigs/bucket/a.gpkg"
+    assert st.vsi_path("https://host/a.gpkg") == "/vsicurl/https://host/a.gpkg"
+    assert st.vsi_path("memory://a.gpkg") is None
+    assert st.vsi_path("/data/a.gpkg") is None
+
+
+def test_state_is_written_once_per_file(capsys):
+    """Ensure STATE messages follow completed files, not record counts."""
+    paths = [os.path.join(BASE, f"test.{ext}") for ext in ("geojson", "gpx")]
+    cfg = {"paths": paths}
+    tap = TapGeo(config={"files": [cfg]})
+    stream = GeoStream(tap, cfg)
+    stream.sync()
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    states = [m["value"] for m in messages if m["type"] == "STATE"]
+    partitions = states[0]["bookmarks"][stream.name]["partitions"]
+    assert partitions[0]["context"] == {"_sdc_filename": "test.geojson"}
+    assert partitions[0]["replication_key"] == "_sdc_last_modified"
+    assert partitions[0]["replication_key_value"]
+    assert "progress_markers" not in partitions[0]
+    assert len(states) == len(paths) + 1
+
+
+def test_pyogrio_layers_are_read_once(monkeypatch):
+    """Ensure the schema peek and the sync share the pyogrio layer headers."""
+    pyogrio = pytest.importorskip("pyogrio")
+    pytest.importorskip("pyarrow")
+
+    cfg = {"paths": [os.path.join(BASE, "stazioni.shp")], "engine": "pyogrio"}
+    tap = TapGeo(config={"files": [cfg]})
+
+    calls = []
+    read_info = pyogrio.read_info
+    monkeypatch.setattr(
+        pyogrio, "read_info", lambda *a, **kw: calls.append(a) or read_info(*a, **kw)
+    )
+
+    stream = GeoStream(tap, cfg)
+    assert stream.schema["properties"]["geometry"]
+    assert list(stream.get_records(context=None))
+    assert len(calls) == 1
+
+
+def test_discovery_dedupes_overlapping_patterns():
+    """Ensure files matched by several patterns of a stream are listed once."""
+    files = [
+        {"paths": [os.path.join(BASE, "test.*"), os.path.join(BASE, "*.geojson")]},
+        {"paths": [os.path.join(BASE, "stazioni.shp")]},
+    ]
+    first, second = TapGeo(config={"files": files}).discover_streams()
+
+    assert len(first.path_patterns) == len(set(first.path_patterns)) == 3
+    assert [os.path.basename(p) for p in second.path_patterns] == ["stazioni.shp"]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (1, ["number", "null"]),
+        (True, ["number", "null"]),
+        ("a", ["string", "null"]),
+        ({"a": 1}, ["object", "null"]),
+        (None, ["null", "string", "object", "number", "array"]),
+    ],
+)
+def test_schema_types_of_values(value, expected):
+    """Ensure record values map to their JSON schema types, bools as numbers."""
+    assert sorted(_schema_type(value).type_dict["type"]) == sorted(expected)
+
+
+def test_writer_flushes_records_with_state(capsys):
+    """Ensure buffered messages reach stdout in order once STATE is written."""
+    writer = GeoSingerWriter()
+    writer.write_message(RecordMessage(stream="a", record={"n": 1}))
+    writer.write_message(RecordMessage(stream="a", record={"n": Decimal("1.5")}))
+    assert capsys.readouterr().out == ""
+
+    writer.write_message(StateMessage(value={"bookmarks": {}}))
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["type"] for line in lines] == ["RECORD", "RECORD", "STATE"]
+    assert json.loads(lines[1])["record"] == {"n": 1.5}